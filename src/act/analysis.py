@@ -57,6 +57,7 @@ def run_ai_analysis(
     results_path: Path,
     model: str = "anthropic/claude-opus-4-5",
     prompt: str | None = None,
+    manager: ContainerManager | None = None,
 ) -> bool:
     """Run OpenCode in a container to analyze results and write analysis.md.
 
@@ -66,6 +67,8 @@ def run_ai_analysis(
         results_path: Path to the results directory to analyze.
         model: Model to use for analysis.
         prompt: Custom analysis prompt. If None, uses a default prompt.
+        manager: Container manager to reuse. If None, a new one is created and
+            cleaned up afterwards; otherwise cleanup is left to the caller.
 
     Returns:
         True if analysis succeeded, False otherwise.
@@ -85,7 +88,9 @@ def run_ai_analysis(
         timeout_seconds=600,
     )
 
-    manager = ContainerManager()
+    owns_manager = manager is None
+    if manager is None:
+        manager = ContainerManager()
     try:
         result = manager.run_analysis(config)
 
@@ -102,4 +107,5 @@ def run_ai_analysis(
         print(f"AI analysis failed: {e}")
         return False
     finally:
-        manager.cleanup()
+        if owns_manager:
+            manager.cleanup()
@@ -1,12 +1,14 @@
 """CLI entry point for act."""
 
+import os
 from pathlib import Path
 
 import typer
 from rich.console import Console
 
 from .analysis import run_ai_analysis
-from .config import load_config
+from .config import BenchmarkConfig, load_config, load_experiment_name
+from .container import ContainerManager
 from .display import ProgressDisplay
 from .runner import ExperimentRunner
 
@@ -19,29 +21,38 @@ app = typer.Typer(
 console = Console()
 
 
-def _run_experiment(config_path: Path, output_dir: Path, no_parallel: bool) -> Path:
-    """Load config, run the experiment, and return the results path.
-
-    Handles config loading, printing experiment info, and error handling.
-    Raises typer.Exit(1) on failure.
-    """
+def _load_config(config_path: Path) -> BenchmarkConfig:
+    """Load a config file, raising typer.Exit(1) if it is invalid."""
     try:
-        config = load_config(config_path)
+        return load_config(config_path)
     except Exception as e:
         console.print(f"[red]Error loading config:[/] {e}")
         raise typer.Exit(1)
 
+
+def _run_experiment(
+    config: BenchmarkConfig,
+    output_dir: Path,
+    no_parallel: bool,
+    container_manager: ContainerManager | None = None,
+) -> Path:
+    """Run the experiment and return the results path.
+
+    Handles printing experiment info and error handling.
+    Raises typer.Exit(1) on failure.
+    """
     if no_parallel:
         config.settings.parallel = False
 
-    console.print(f"[bold]Running experiment:[/] {config.experiment.name}")
-    console.print(f"Target: {config.target.repo}")
-    console.print(f"Agents: {', '.join(a.id for a in config.agents)}")
-    console.print(f"Runs per agent: {config.settings.runs_per_agent}")
-    console.print()
+    console.print(
+        f"[bold]Running experiment:[/] {config.experiment.name}\n"
+        f"Target: {config.target.repo}\n"
+        f"Agents: {', '.join(a.id for a in config.agents)}\n"
+        f"Runs per agent: {config.settings.runs_per_agent}\n"
+    )
 
     display = ProgressDisplay(console)
-    runner = ExperimentRunner(config, output_dir, display)
+    runner = ExperimentRunner(config, output_dir, display, container_manager)
 
     try:
         results_path = runner.run()
@@ -79,7 +90,8 @@ def run(
     ),
 ) -> None:
     """Run a benchmark experiment."""
-    _run_experiment(config_path, output_dir, no_parallel)
+    config = _load_config(config_path)
+    _run_experiment(config, output_dir, no_parallel)
 
 
 @app.command()
@@ -105,22 +117,19 @@ def analyze(
         console.print("[red]No config.toml found in results directory[/]")
         raise typer.Exit(1)
 
-    try:
-        config = load_config(config_file)
-    except Exception as e:
-        console.print(f"[red]Error loading config:[/] {e}")
-        raise typer.Exit(1)
+    config = _load_config(config_file)
 
     if not config.analysis or not config.analysis.prompt:
-        console.print("[red]No [analysis] section with prompt configured[/]")
-        console.print("Add an [analysis] section to your experiment config:")
-        console.print("  [analysis]")
-        console.print('  model = "anthropic/claude-sonnet-4-5"')
-        console.print('  prompt = "Your analysis criteria here"')
+        console.print(
+            "[red]No \\[analysis] section with prompt configured[/]\n"
+            "Add an \\[analysis] section to your experiment config:\n"
+            "  \\[analysis]\n"
+            '  model = "anthropic/claude-sonnet-4-5"\n'
+            '  prompt = "Your analysis criteria here"'
+        )
         raise typer.Exit(1)
 
-    console.print(f"[bold]Running AI analysis with {config.analysis.model}...[/]")
-    console.print()
+    console.print(f"[bold]Running AI analysis with {config.analysis.model}...[/]\n")
 
     success = run_ai_analysis(
         results_path=results_dir,
@@ -159,28 +168,30 @@ def run_and_analyze(
     Combines 'run' and 'analyze' commands into a single workflow.
     Requires [analysis] section in the experiment config.
     """
-    try:
-        config = load_config(config_path)
-    except Exception as e:
-        console.print(f"[red]Error loading config:[/] {e}")
-        raise typer.Exit(1)
+    config = _load_config(config_path)
 
     if not config.analysis or not config.analysis.prompt:
-        console.print("[red]No [analysis] section with prompt configured[/]")
-        console.print("Add an [analysis] section to your experiment config for run-and-analyze")
+        console.print(
+            "[red]No \\[analysis] section with prompt configured[/]\n"
+            "Add an \\[analysis] section to your experiment config for run-and-analyze"
+        )
         raise typer.Exit(1)
 
-    results_path = _run_experiment(config_path, output_dir, no_parallel)
+    # Share one manager so the image check is only paid once across both phases
+    container_manager = ContainerManager()
+    try:
+        results_path = _run_experiment(config, output_dir, no_parallel, container_manager)
 
-    console.print()
-    console.print(f"[bold]Running AI analysis with {config.analysis.model}...[/]")
-    console.print()
+        console.print(f"\n[bold]Running AI analysis with {config.analysis.model}...[/]\n")
 
-    success = run_ai_analysis(
-        results_path=results_path,
-        model=config.analysis.model,
-        prompt=config.analysis.prompt,
-    )
+        success = run_ai_analysis(
+            results_path=results_path,
+            model=config.analysis.model,
+            prompt=config.analysis.prompt,
+            manager=container_manager,
+        )
+    finally:
+        container_manager.cleanup()
 
     if success:
         console.print()
@@ -203,8 +214,8 @@ def list_experiments(
         console.print("[yellow]No results directory found[/]")
         return
 
-    experiments = sorted(results_dir.iterdir())
-    experiments = [e for e in experiments if e.is_dir()]
+    with os.scandir(results_dir) as entries:
+        experiments = sorted(Path(e.path) for e in entries if e.is_dir())
 
     if not experiments:
         console.print("[yellow]No experiments found[/]")
@@ -212,14 +223,11 @@ def list_experiments(
 
     console.print("[bold]Past experiments:[/]")
     for exp in experiments:
-        config_file = exp / "config.toml"
         name = exp.name
-        if config_file.exists():
-            try:
-                config = load_config(config_file)
-                name = f"{config.experiment.name} ({exp.name})"
-            except Exception:
-                pass
+        try:
+            name = f"{load_experiment_name(exp / 'config.toml')} ({exp.name})"
+        except Exception:
+            pass
         console.print(f"  - {name}")
 
 
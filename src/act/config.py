@@ -41,6 +41,8 @@ class SettingsConfig(BaseModel):
     runs_per_agent: int = Field(default=3, ge=1, le=10)
     parallel: bool = True
     timeout_minutes: int = Field(default=10, ge=1, le=180)
+    max_parallel: int | None = Field(default=None, ge=1)
+    workspace_tmpfs: bool = False
 
 
 class AgentConfig(BaseModel):
@@ -83,3 +85,10 @@ def load_config(path: Path) -> BenchmarkConfig:
     with open(path, "rb") as f:
         data = tomllib.load(f)
     return BenchmarkConfig.model_validate(data)
+
+
+def load_experiment_name(path: Path) -> str:
+    """Read just the experiment name from a TOML file, skipping full validation."""
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+    return data["experiment"]["name"]
@@ -1,24 +1,32 @@
 """Container management for running agent benchmarks."""
 
+import codecs
 import logging
 import os
 import re
 import shutil
+import subprocess
 import sys
 import tempfile
+import threading
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from docker.errors import ContainerError, ImageNotFound
-from docker.models.containers import Container
 
 import docker
 
 logger = logging.getLogger(__name__)
 
-_ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*[a-zA-Z]")
+_ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*[a-zA-Z]", re.ASCII)
 _TOOL_PREFIXES = ("→ ", "← ", "✱ ", "$ ", "⚙ ", "• ")
+# Leading characters of _TOOL_PREFIXES, for a cheap reject before prefix matching
+_TOOL_PREFIX_CHARS = frozenset(prefix[0] for prefix in _TOOL_PREFIXES)
+_TOOL_PREFIX_BYTES = tuple(prefix.encode() for prefix in _TOOL_PREFIXES)
+# Longest incomplete line carried between chunks; only a line's start decides
+# whether it is an activity, and the display shows far less than this
+_MAX_PARTIAL_LINE = 4096
 
 
 def parse_activity_line(raw_line: str) -> str | None:
@@ -27,12 +35,38 @@ def parse_activity_line(raw_line: str) -> str | None:
     Strips ANSI escape codes and checks for known OpenCode tool prefixes.
     Returns the cleaned line if it matches, None otherwise.
     """
-    cleaned = _ANSI_ESCAPE_RE.sub("", raw_line).strip()
-    if any(cleaned.startswith(prefix) for prefix in _TOOL_PREFIXES):
+    if "\x1b" in raw_line:
+        raw_line = _ANSI_ESCAPE_RE.sub("", raw_line)
+    cleaned = raw_line.strip()
+    if not cleaned or cleaned[0] not in _TOOL_PREFIX_CHARS:
+        return None
+    if cleaned.startswith(_TOOL_PREFIXES):
         return cleaned
     return None
 
 
+def scan_activity_lines(data: bytes) -> tuple[list[str], bytes]:
+    """Extract activity descriptions from the complete lines of a raw log buffer.
+
+    Only lines containing a tool prefix are decoded. Returns the activities
+    found and the trailing incomplete line, to be prepended to the next chunk.
+    The incomplete line is truncated to its first _MAX_PARTIAL_LINE bytes so
+    long newline-free output is not re-copied with every chunk.
+    """
+    end = data.rfind(b"\n") + 1
+    complete, partial = data[:end], data[end : end + _MAX_PARTIAL_LINE]
+    if not any(prefix in complete for prefix in _TOOL_PREFIX_BYTES):
+        return [], partial
+
+    activities = []
+    for line in complete.splitlines():
+        if any(prefix in line for prefix in _TOOL_PREFIX_BYTES):
+            activity = parse_activity_line(line.decode("utf-8", "replace"))
+            if activity:
+                activities.append(activity)
+    return activities, partial
+
+
 @dataclass
 class ContainerConfig:
     """Configuration for a single container run."""
@@ -54,6 +88,8 @@ class ContainerResult:
 
     run_id: str
     exit_code: int
+    # Empty when output was streamed to an activity callback; run.log in the
+    # workspace is the full record either way
     logs: str
     workspace_path: Path
     error: str | None = None
@@ -85,30 +121,52 @@ class ContainerManager:
 
     IMAGE_NAME = "act-opencode"
     DOCKER_DIR = Path(__file__).parent.parent.parent / "docker"
+    # The Docker daemon serialises container creation past roughly this many requests
+    MAX_CONCURRENT_STARTS = 10
 
     def __init__(self) -> None:
         self.client = docker.from_env()
+        # Low-level client for the wait/logs/remove hot path; skips model wrapping
+        self._api = self.client.api
         self._image_built = False
-        self._containers: dict[str, Container] = {}
+        self._image_lock = threading.Lock()
+        self._start_semaphore = threading.Semaphore(self.MAX_CONCURRENT_STARTS)
+        # Container ids by run id
+        self._containers: dict[str, str] = {}
+        # Built once; merged into every container's volumes when auth exists
+        auth_path = Path.home() / ".local/share/opencode/auth.json"
+        self._auth_volume: dict[str, dict[str, str]] = {}
+        if auth_path.exists():
+            self._auth_volume[str(auth_path)] = {
+                "bind": "/home/agent/.local/share/opencode/auth.json",
+                "mode": "rw",
+            }
 
     def ensure_image(self) -> None:
-        """Build the Docker image if not already built."""
+        """Build the Docker image if not already built.
+
+        Safe to call from several worker threads; only the first builds.
+        """
         if self._image_built:
             return
 
-        try:
-            self.client.images.get(self.IMAGE_NAME)
-            self._image_built = True
-            return
-        except ImageNotFound:
-            pass
+        with self._image_lock:
+            if self._image_built:
+                return
 
-        self.client.images.build(
-            path=str(self.DOCKER_DIR),
-            tag=self.IMAGE_NAME,
-            rm=True,
-        )
-        self._image_built = True
+            try:
+                self.client.images.get(self.IMAGE_NAME)
+                self._image_built = True
+                return
+            except ImageNotFound:
+                pass
+
+            self.client.images.build(
+                path=str(self.DOCKER_DIR),
+                tag=self.IMAGE_NAME,
+                rm=True,
+            )
+            self._image_built = True
 
     def run(
         self,
@@ -135,45 +193,48 @@ class ContainerManager:
             env["OPENCODE_EXTRA_ARGS"] = " ".join(config.extra_args)
 
         home_dir = tempfile.mkdtemp(prefix="act-home-")
-        auth_path = Path.home() / ".local/share/opencode/auth.json"
         volumes = {
             str(config.workspace_path): {"bind": "/workspace", "mode": "rw"},
             home_dir: {"bind": "/home/agent", "mode": "rw"},
+            **self._auth_volume,
         }
-        if auth_path.exists():
+        if self._auth_volume:
             opencode_data = Path(home_dir) / ".local" / "share" / "opencode"
             opencode_data.mkdir(parents=True)
-            volumes[str(auth_path)] = {
-                "bind": "/home/agent/.local/share/opencode/auth.json",
-                "mode": "rw",
-            }
 
         try:
-            container = self.client.containers.run(
-                self.IMAGE_NAME,
-                environment=env,
-                volumes=volumes,
-                detach=True,
-                mem_limit="4g",
-                user=f"{os.getuid()}:{os.getgid()}",
-            )
-            self._containers[config.run_id] = container
+            with self._start_semaphore:
+                container = self.client.containers.run(
+                    self.IMAGE_NAME,
+                    environment=env,
+                    volumes=volumes,
+                    detach=True,
+                    mem_limit="4g",
+                    user=f"{os.getuid()}:{os.getgid()}",
+                )
+            container_id = container.id
+            self._containers[config.run_id] = container_id
 
             if activity_callback is not None:
-                all_logs: list[str] = []
-                for chunk in container.logs(stream=True, follow=True):
-                    text = chunk.decode("utf-8")
-                    all_logs.append(text)
-                    activity = parse_activity_line(text)
-                    if activity:
+                # Chunks are only scanned for activity, not kept: the entrypoint
+                # already tees the full output to run.log in the workspace
+                partial = b""
+                for chunk in self._api.logs(
+                    container_id, stream=True, follow=True, stdout=True, stderr=True
+                ):
+                    activities, partial = scan_activity_lines(partial + chunk)
+                    for activity in activities:
                         activity_callback(activity)
+                activities, _ = scan_activity_lines(partial + b"\n")
+                for activity in activities:
+                    activity_callback(activity)
 
-                result = container.wait(timeout=config.timeout_seconds)
+                result = self._api.wait(container_id, timeout=config.timeout_seconds)
                 exit_code = result.get("StatusCode", 1)
-                logs = "".join(all_logs)
+                logs = ""
             else:
-                result = container.wait(timeout=config.timeout_seconds)
-                logs = container.logs().decode("utf-8")
+                result = self._api.wait(container_id, timeout=config.timeout_seconds)
+                logs = self._api.logs(container_id).decode("utf-8", "replace")
                 exit_code = result.get("StatusCode", 1)
 
             return ContainerResult(
@@ -186,7 +247,7 @@ class ContainerManager:
         except ContainerError as e:
             stderr = e.stderr
             if isinstance(stderr, bytes):
-                stderr = stderr.decode("utf-8")
+                stderr = stderr.decode("utf-8", "replace")
             return ContainerResult(
                 run_id=config.run_id,
                 exit_code=1,
@@ -203,12 +264,13 @@ class ContainerManager:
                 error=str(e),
             )
         finally:
-            if config.run_id in self._containers:
+            # pop() so a concurrent cleanup() cannot race us between check and delete
+            container_id = self._containers.pop(config.run_id, None)
+            if container_id is not None:
                 try:
-                    self._containers[config.run_id].remove(force=True)
+                    self._api.remove_container(container_id, force=True)
                 except Exception as e:
                     logger.warning("Failed to remove container %s: %s", config.run_id, e)
-                del self._containers[config.run_id]
             shutil.rmtree(home_dir, ignore_errors=True)
 
     def run_analysis(
@@ -238,7 +300,6 @@ class ContainerManager:
             if config.model:
                 env["OPENCODE_MODEL"] = config.model
 
-            auth_path = Path.home() / ".local/share/opencode/auth.json"
             volumes = {
                 str(config.results_path): {"bind": "/workspace/results", "mode": "rw"},
                 str(system_prompt_file): {
@@ -246,41 +307,46 @@ class ContainerManager:
                     "mode": "ro",
                 },
                 str(home_path): {"bind": "/home/agent", "mode": "rw"},
+                **self._auth_volume,
             }
-            if auth_path.exists():
+            if self._auth_volume:
                 opencode_data = home_path / ".local" / "share" / "opencode"
                 opencode_data.mkdir(parents=True)
-                volumes[str(auth_path)] = {
-                    "bind": "/home/agent/.local/share/opencode/auth.json",
-                    "mode": "rw",
-                }
 
-            container_id = f"analysis-{id(config)}"
-            all_logs: list[str] = []
+            run_key = f"analysis-{id(config)}"
+            all_logs: list[bytes] = []
 
             try:
-                container = self.client.containers.run(
-                    self.IMAGE_NAME,
-                    entrypoint="/analyze-entrypoint.sh",
-                    environment=env,
-                    volumes=volumes,
-                    detach=True,
-                    mem_limit="4g",
-                    user=f"{os.getuid()}:{os.getgid()}",
-                )
-                self._containers[container_id] = container
+                with self._start_semaphore:
+                    container = self.client.containers.run(
+                        self.IMAGE_NAME,
+                        entrypoint="/analyze-entrypoint.sh",
+                        environment=env,
+                        volumes=volumes,
+                        detach=True,
+                        mem_limit="4g",
+                        user=f"{os.getuid()}:{os.getgid()}",
+                    )
+                container_id = container.id
+                self._containers[run_key] = container_id
 
                 if stream_output:
-                    for chunk in container.logs(stream=True, follow=True):
-                        text = chunk.decode("utf-8")
-                        all_logs.append(text)
-                        sys.stdout.write(text)
+                    # Incremental so multibyte characters split across chunks survive,
+                    # without relying on sys.stdout having a binary .buffer
+                    decoder = codecs.getincrementaldecoder("utf-8")("replace")
+                    for chunk in self._api.logs(
+                        container_id, stream=True, follow=True, stdout=True, stderr=True
+                    ):
+                        all_logs.append(chunk)
+                        sys.stdout.write(decoder.decode(chunk))
                         sys.stdout.flush()
+                    sys.stdout.write(decoder.decode(b"", final=True))
 
-                result = container.wait(timeout=config.timeout_seconds)
+                result = self._api.wait(container_id, timeout=config.timeout_seconds)
                 exit_code = result.get("StatusCode", 1)
 
-                logs = "".join(all_logs) if all_logs else container.logs().decode("utf-8")
+                raw_logs = b"".join(all_logs) if all_logs else self._api.logs(container_id)
+                logs = raw_logs.decode("utf-8", "replace")
 
                 return AnalysisResult(
                     exit_code=exit_code,
@@ -291,7 +357,7 @@ class ContainerManager:
             except ContainerError as e:
                 stderr = e.stderr
                 if isinstance(stderr, bytes):
-                    stderr = stderr.decode("utf-8")
+                    stderr = stderr.decode("utf-8", "replace")
                 return AnalysisResult(
                     exit_code=1,
                     logs=stderr or "",
@@ -306,21 +372,23 @@ class ContainerManager:
                     error=str(e),
                 )
             finally:
-                if container_id in self._containers:
+                container_id = self._containers.pop(run_key, None)
+                if container_id is not None:
                     try:
-                        self._containers[container_id].remove(force=True)
+                        self._api.remove_container(container_id, force=True)
                     except Exception as e:
                         logger.warning("Failed to remove analysis container: %s", e)
-                    del self._containers[container_id]
 
     def cleanup(self) -> None:
         """Clean up any running containers."""
-        for run_id, container in list(self._containers.items()):
+        for run_id in list(self._containers):
+            container_id = self._containers.pop(run_id, None)
+            if container_id is None:
+                continue
             try:
-                container.remove(force=True)
+                self._api.remove_container(container_id, force=True)
             except Exception as e:
                 logger.warning("Failed to remove container %s during cleanup: %s", run_id, e)
-            self._containers.pop(run_id, None)
 
 
 @dataclass
@@ -342,14 +410,46 @@ class WorkspaceManager:
         return self._workspaces.get(run_id)
 
     def copy_results(self, run_id: str, dest: Path) -> None:
-        """Copy workspace contents to a destination."""
+        """Copy workspace contents to a destination.
+
+        On Linux, uses `cp --reflink=auto` so copy-on-write filesystems clone
+        file extents instead of copying bytes. Falls back to shutil.copytree.
+        """
         workspace = self._workspaces.get(run_id)
-        if workspace and workspace.exists():
-            shutil.copytree(workspace, dest, dirs_exist_ok=True)
+        if not workspace or not workspace.exists():
+            return
 
-    def cleanup(self) -> None:
-        """Clean up all workspace directories."""
-        for workspace in self._workspaces.values():
-            if workspace.exists():
-                shutil.rmtree(workspace, ignore_errors=True)
-        self._workspaces.clear()
+        if sys.platform.startswith("linux"):
+            dest.mkdir(parents=True, exist_ok=True)
+            try:
+                result = subprocess.run(
+                    ["cp", "-a", "--reflink=auto", f"{workspace}/.", str(dest)],
+                    check=False,
+                    stderr=subprocess.DEVNULL,
+                )
+                if result.returncode == 0:
+                    return
+            except OSError:
+                pass
+
+        shutil.copytree(workspace, dest, dirs_exist_ok=True)
+
+    def move_results(self, run_id: str, dest: Path) -> None:
+        """Move workspace contents to a destination.
+
+        Renames the workspace into place when both paths share a filesystem,
+        avoiding a full copy and the later deletion. Falls back to copy_results.
+        The workspace no longer exists afterwards if the rename succeeds.
+        """
+        workspace = self._workspaces.get(run_id)
+        if not workspace or not workspace.exists():
+            return
+
+        try:
+            if workspace.stat().st_dev == dest.parent.stat().st_dev:
+                os.rename(workspace, dest)
+                return
+        except OSError:
+            pass
+
+        self.copy_results(run_id, dest)
@@ -1,26 +1,17 @@
 """Rich TUI display for benchmark progress."""
 
+import bisect
+import threading
 import time
-from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
 
-from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 
 
-class _DynamicRenderable:
-    """Wraps a callable so Rich re-evaluates it on every render."""
-
-    def __init__(self, fn: Callable[[], RenderableType]) -> None:
-        self._fn = fn
-
-    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
-        yield self._fn()
-
-
 class RunStatus(Enum):
     """Status of a benchmark run."""
 
@@ -31,6 +22,19 @@ class RunStatus(Enum):
     TIMEOUT = "timeout"
 
 
+_STATUS_STYLES = {
+    RunStatus.PENDING: "dim",
+    RunStatus.RUNNING: "yellow",
+    RunStatus.COMPLETED: "green",
+    RunStatus.FAILED: "red",
+    RunStatus.TIMEOUT: "red",
+}
+# Pre-rendered Status column markup, one per status
+_STATUS_CELLS = {status: f"[{style}]{status.value}[/]" for status, style in _STATUS_STYLES.items()}
+# Minimum seconds between change-driven redraws
+_MIN_REFRESH_INTERVAL = 0.25
+
+
 @dataclass
 class RunState:
     """State of a single benchmark run."""
@@ -52,16 +56,23 @@ class ExperimentState:
     name: str
     total_runs: int
     runs: dict[str, RunState] = field(default_factory=dict)
+    _completed: int = field(default=0, init=False)
+    _successful: int = field(default=0, init=False)
 
     @property
     def completed_runs(self) -> int:
-        return sum(
-            1 for r in self.runs.values() if r.status in (RunStatus.COMPLETED, RunStatus.FAILED)
-        )
+        return self._completed
 
     @property
     def successful_runs(self) -> int:
-        return sum(1 for r in self.runs.values() if r.status == RunStatus.COMPLETED)
+        return self._successful
+
+    def set_status(self, run: RunState, status: RunStatus) -> None:
+        """Change a run's status, keeping the progress counters in step."""
+        completed = (RunStatus.COMPLETED, RunStatus.FAILED)
+        self._completed += (status in completed) - (run.status in completed)
+        self._successful += (status == RunStatus.COMPLETED) - (run.status == RunStatus.COMPLETED)
+        run.status = status
 
 
 class ProgressDisplay:
@@ -71,12 +82,29 @@ class ProgressDisplay:
         self.console = console or Console()
         self.state: ExperimentState | None = None
         self._live: Live | None = None
+        self._lock = threading.Lock()
+        # Rendering cache: rows only change on events, except elapsed time of running runs
+        self._dirty = True
+        self._panel: Panel | None = None
+        self._row_cache: dict[str, tuple[str, ...]] = {}
+        self._running: set[str] = set()
+        self._last_refresh = 0.0
+        # Run ids kept sorted on insertion so frames don't re-sort every run
+        self._ordered_ids: list[str] = []
 
     def start(self, experiment_name: str, total_runs: int) -> None:
         """Start the progress display."""
-        self.state = ExperimentState(name=experiment_name, total_runs=total_runs)
+        with self._lock:
+            self.state = ExperimentState(name=experiment_name, total_runs=total_runs)
+            # Run ids repeat across experiments, so nothing rendered before may survive
+            self._ordered_ids = []
+            self._row_cache.clear()
+            self._running.clear()
+            self._panel = None
+            self._dirty = True
+        # The slow tick only advances elapsed times; changes redraw via _request_refresh
         self._live = Live(
-            _DynamicRenderable(self._make_panel), console=self.console, refresh_per_second=4
+            get_renderable=self._make_panel, console=self.console, refresh_per_second=1
         )
         self._live.start()
 
@@ -84,12 +112,14 @@ class ProgressDisplay:
         """Register a new run."""
         if self.state is None:
             raise RuntimeError("Display not started")
+        if run_id not in self.state.runs:
+            bisect.insort(self._ordered_ids, run_id)
         self.state.runs[run_id] = RunState(
             run_id=run_id,
             agent_id=agent_id,
             run_number=run_number,
         )
-        self._refresh()
+        self._invalidate(run_id)
 
     def update_run(
         self,
@@ -102,27 +132,98 @@ class ProgressDisplay:
         if self.state is None or run_id not in self.state.runs:
             return
         run = self.state.runs[run_id]
-        run.status = status
-        run.duration = duration
-        run.error = error
-        if status == RunStatus.RUNNING:
-            run.started_at = time.monotonic()
-        if status in (RunStatus.COMPLETED, RunStatus.FAILED, RunStatus.TIMEOUT):
-            run.started_at = None
-            run.activity = ""
-        self._refresh()
+        # Worker threads report concurrently with rendering; the lock keeps the
+        # counters consistent and stops a stale row being cached mid-update
+        with self._lock:
+            self.state.set_status(run, status)
+            run.duration = duration
+            run.error = error
+            if status == RunStatus.RUNNING:
+                run.started_at = time.monotonic()
+                self._running.add(run_id)
+            else:
+                self._running.discard(run_id)
+            if status in (RunStatus.COMPLETED, RunStatus.FAILED, RunStatus.TIMEOUT):
+                run.started_at = None
+                run.activity = ""
+            self._row_cache.pop(run_id, None)
+            self._dirty = True
+        self._request_refresh()
 
     def update_activity(self, run_id: str, activity: str) -> None:
         """Update the activity description of a running task."""
         if self.state is None or run_id not in self.state.runs:
             return
         self.state.runs[run_id].activity = activity
+        self._dirty = True
+        self._request_refresh()
+
+    def _invalidate(self, run_id: str) -> None:
+        """Drop the cached row for a run and mark the panel for rebuild."""
+        with self._lock:
+            self._row_cache.pop(run_id, None)
+            self._dirty = True
+        self._request_refresh()
+
+    def _request_refresh(self) -> None:
+        """Redraw soon after a change, at most once per _MIN_REFRESH_INTERVAL.
+
+        Changes inside the interval are picked up by the next Live tick. Must be
+        called without self._lock held, since the redraw acquires it.
+        """
+        # stop() may clear self._live from another thread while workers still report
+        live = self._live
+        now = time.monotonic()
+        if live is None or now - self._last_refresh < _MIN_REFRESH_INTERVAL:
+            return
+        self._last_refresh = now
+        live.refresh()
+
+    def _make_row(self, run: RunState) -> tuple[str, ...]:
+        """Create the table cells for a run, reusing cached cells when unchanged.
+
+        Called with self._lock held, so the run cannot change while it is read.
+        """
+        cached = self._row_cache.get(run.run_id)
+        if cached is not None:
+            return cached
+
+        if run.status == RunStatus.RUNNING and run.started_at is not None:
+            elapsed = time.monotonic() - run.started_at
+            duration_str = f"{elapsed:.1f}s"
+        elif run.duration > 0:
+            duration_str = f"{run.duration:.1f}s"
+        else:
+            duration_str = "-"
+        activity_str = run.activity if run.status == RunStatus.RUNNING else ""
+
+        row = (
+            run.run_id,
+            run.agent_id,
+            str(run.run_number),
+            _STATUS_CELLS[run.status],
+            duration_str,
+            f"[dim]{activity_str}[/]",
+        )
+        # Running rows tick every frame, so only cache rows that are settled
+        if run.status != RunStatus.RUNNING:
+            self._row_cache[run.run_id] = row
+        return row
 
     def _make_panel(self) -> Panel:
-        """Create the display panel."""
+        """Create the display panel, reusing the last one if nothing changed."""
         if self.state is None:
             return Panel("No experiment running")
 
+        with self._lock:
+            return self._build_panel(self.state)
+
+    def _build_panel(self, state: ExperimentState) -> Panel:
+        """Build the panel from current state. Called with self._lock held."""
+        if self._panel is not None and not self._dirty and not self._running:
+            return self._panel
+        self._dirty = False
+
         table = Table(show_header=True, header_style="bold")
         table.add_column("Run ID")
         table.add_column("Agent")
@@ -131,48 +232,21 @@ class ProgressDisplay:
         table.add_column("Duration")
         table.add_column("Activity", max_width=40, no_wrap=True)
 
-        for run in sorted(self.state.runs.values(), key=lambda r: r.run_id):
-            status_style = {
-                RunStatus.PENDING: "dim",
-                RunStatus.RUNNING: "yellow",
-                RunStatus.COMPLETED: "green",
-                RunStatus.FAILED: "red",
-                RunStatus.TIMEOUT: "red",
-            }.get(run.status, "")
-
-            if run.status == RunStatus.RUNNING and run.started_at is not None:
-                elapsed = time.monotonic() - run.started_at
-                duration_str = f"{elapsed:.1f}s"
-            elif run.duration > 0:
-                duration_str = f"{run.duration:.1f}s"
-            else:
-                duration_str = "-"
-            activity_str = run.activity if run.status == RunStatus.RUNNING else ""
-
-            table.add_row(
-                run.run_id,
-                run.agent_id,
-                str(run.run_number),
-                f"[{status_style}]{run.status.value}[/]",
-                duration_str,
-                f"[dim]{activity_str}[/]",
-            )
+        runs = state.runs
+        for run_id in self._ordered_ids:
+            table.add_row(*self._make_row(runs[run_id]))
 
         progress_text = (
-            f"Progress: {self.state.completed_runs}/{self.state.total_runs} "
-            f"({self.state.successful_runs} successful)"
+            f"Progress: {state.completed_runs}/{state.total_runs} "
+            f"({state.successful_runs} successful)"
         )
 
-        return Panel(
+        self._panel = Panel(
             table,
-            title=f"[bold]{self.state.name}[/]",
+            title=f"[bold]{state.name}[/]",
             subtitle=progress_text,
         )
-
-    def _refresh(self) -> None:
-        """Refresh the display."""
-        if self._live:
-            self._live.update(self._make_panel())
+        return self._panel
 
     def stop(self) -> None:
         """Stop the progress display."""
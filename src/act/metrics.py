@@ -1,11 +1,14 @@
 """Metrics collection for benchmark runs."""
 
-import json
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import BinaryIO
 
+import ijson
+import orjson
 
-@dataclass
+
+@dataclass(slots=True)
 class RunMetrics:
     """Complete metrics for a benchmark run."""
 
@@ -16,64 +19,64 @@ class RunMetrics:
     token_usage: dict[str, int] = field(default_factory=dict)
     error: str | None = None
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "run_id": self.run_id,
-            "agent_id": self.agent_id,
-            "exit_code": self.exit_code,
-            "duration_seconds": self.duration_seconds,
-            "token_usage": self.token_usage,
-            "error": self.error,
-        }
-
 
 def load_container_metrics(workspace_path: Path) -> dict:
     """Load metrics written by the container entrypoint."""
     metrics_file = workspace_path / "metrics.json"
     if metrics_file.exists():
         try:
-            return json.loads(metrics_file.read_text())
+            return orjson.loads(metrics_file.read_bytes())
         except Exception:
             pass
     return {}
 
 
+def _session_tokens_prefix(f: BinaryIO) -> str:
+    """Return the ijson prefix of per-message token counts in a session export.
+
+    Exports are either an object with a "messages" array or a bare array of
+    messages, so peek at the first non-whitespace byte to tell them apart.
+    """
+    while (char := f.read(1)) and char.isspace():
+        pass
+    f.seek(0)
+    return "item.info.tokens" if char == b"[" else "messages.item.info.tokens"
+
+
 def extract_token_usage_from_session(workspace_path: Path) -> dict[str, int]:
     """Extract token usage from an OpenCode session export.
 
-    Reads opencode_session.json and sums token counts across all messages.
+    Streams opencode_session.json and sums token counts across all messages
+    without building the full session in memory.
     """
     session_file = workspace_path / "opencode_session.json"
+
+    total = input_ = output = reasoning = cache_read = cache_write = 0
+
     try:
-        session = json.loads(session_file.read_text())
-        messages = session.get("messages", []) if isinstance(session, dict) else session
+        with open(session_file, "rb") as f:
+            prefix = _session_tokens_prefix(f)
+            # Most messages in tool-heavy sessions carry no token counts
+            for tokens in filter(None, ijson.items(f, prefix, use_float=True)):
+                total += tokens.get("total", 0)
+                input_ += tokens.get("input", 0)
+                output += tokens.get("output", 0)
+                reasoning += tokens.get("reasoning", 0)
+                cache = tokens.get("cache") or {}
+                cache_read += cache.get("read", 0)
+                cache_write += cache.get("write", 0)
     except Exception:
         return {}
 
-    totals: dict[str, int] = {
-        "total": 0,
-        "input": 0,
-        "output": 0,
-        "reasoning": 0,
-        "cache_read": 0,
-        "cache_write": 0,
+    return {
+        "total": total,
+        "input": input_,
+        "output": output,
+        "reasoning": reasoning,
+        "cache_read": cache_read,
+        "cache_write": cache_write,
     }
 
-    for msg in messages:
-        tokens = (msg.get("info") or {}).get("tokens")
-        if not tokens:
-            continue
-        totals["total"] += tokens.get("total", 0)
-        totals["input"] += tokens.get("input", 0)
-        totals["output"] += tokens.get("output", 0)
-        totals["reasoning"] += tokens.get("reasoning", 0)
-        cache = tokens.get("cache") or {}
-        totals["cache_read"] += cache.get("read", 0)
-        totals["cache_write"] += cache.get("write", 0)
-
-    return totals
-
 
 def collect_run_metrics(
     run_id: str,
@@ -101,5 +104,5 @@ def collect_run_metrics(
 def save_metrics(metrics: RunMetrics, output_path: Path) -> None:
     """Save metrics to a JSON file."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(metrics.to_dict(), f, indent=2)
+    # orjson serializes dataclasses natively, so the field order is the file format
+    output_path.write_bytes(orjson.dumps(metrics, option=orjson.OPT_INDENT_2))
@@ -1,6 +1,8 @@
 """Tests for container module utilities."""
 
-from act.container import parse_activity_line
+from pathlib import Path
+
+from act.container import WorkspaceManager, parse_activity_line, scan_activity_lines
 
 
 class TestParseActivityLine:
@@ -53,3 +55,83 @@ class TestParseActivityLine:
     def test_regular_log_with_ansi_returns_none(self):
         line = "\x1b[32mINFO\x1b[0m: Container started successfully"
         assert parse_activity_line(line) is None
+
+
+class TestScanActivityLines:
+    def test_returns_activities_from_complete_lines(self):
+        data = "Starting...\n\x1b[34m→ Read\x1b[0m src/main.py\n$ git status\n".encode()
+        activities, partial = scan_activity_lines(data)
+        assert activities == ["→ Read src/main.py", "$ git status"]
+        assert partial == b""
+
+    def test_keeps_incomplete_trailing_line(self):
+        activities, partial = scan_activity_lines("✱ Glob done\n→ Re".encode())
+        assert activities == ["✱ Glob done"]
+        assert partial == "→ Re".encode()
+
+    def test_no_prefix_bytes_skips_decoding(self):
+        activities, partial = scan_activity_lines(b"plain output\nmore")
+        assert activities == []
+        assert partial == b"more"
+
+    def test_multibyte_prefix_split_across_chunks(self):
+        encoded = "⚙ Settings\n".encode()
+        activities, partial = scan_activity_lines(encoded[:2])
+        assert activities == []
+        activities, partial = scan_activity_lines(partial + encoded[2:])
+        assert activities == ["⚙ Settings"]
+        assert partial == b""
+
+    def test_long_unterminated_line_is_bounded(self):
+        partial = b""
+        for _ in range(1000):
+            activities, partial = scan_activity_lines(partial + b"\r" + b"x" * 100)
+            assert activities == []
+        assert len(partial) <= 4096
+
+        activities, partial = scan_activity_lines(partial + b"\n$ ls\n")
+        assert activities == ["$ ls"]
+        assert partial == b""
+
+    def test_long_activity_line_keeps_its_start(self):
+        partial = "→ Read ".encode()
+        for _ in range(100):
+            _, partial = scan_activity_lines(partial + b"x" * 100)
+        activities, _ = scan_activity_lines(partial + b"\n")
+        assert len(activities) == 1
+        assert activities[0].startswith("→ Read xxx")
+
+
+class TestWorkspaceManager:
+    def test_copy_results_copies_nested_and_hidden_files(self, tmp_path: Path):
+        manager = WorkspaceManager(tmp_path / "workspaces")
+        workspace = manager.create("run-1")
+        (workspace / "repo").mkdir()
+        (workspace / "repo" / "plan.md").write_text("# Plan")
+        (workspace / ".benchmark").mkdir()
+        (workspace / ".benchmark" / "run.log").write_text("log")
+
+        dest = tmp_path / "results" / "run-1"
+        dest.mkdir(parents=True)
+        manager.copy_results("run-1", dest)
+
+        assert (dest / "repo" / "plan.md").read_text() == "# Plan"
+        assert (dest / ".benchmark" / "run.log").read_text() == "log"
+
+    def test_copy_results_unknown_run_is_noop(self, tmp_path: Path):
+        manager = WorkspaceManager(tmp_path / "workspaces")
+        dest = tmp_path / "dest"
+        manager.copy_results("missing", dest)
+        assert not dest.exists()
+
+    def test_move_results_renames_workspace(self, tmp_path: Path):
+        manager = WorkspaceManager(tmp_path / "workspaces")
+        workspace = manager.create("run-1")
+        (workspace / "run.log").write_text("log")
+
+        dest = tmp_path / "results" / "run-1"
+        dest.mkdir(parents=True)
+        manager.move_results("run-1", dest)
+
+        assert (dest / "run.log").read_text() == "log"
+        assert not workspace.exists()
@@ -0,0 +1,68 @@
+"""Tests for progress display state."""
+
+import io
+
+from rich.console import Console
+
+from act.display import ExperimentState, ProgressDisplay, RunState, RunStatus
+
+
+def _state_with_run() -> tuple[ExperimentState, RunState]:
+    state = ExperimentState(name="exp", total_runs=1)
+    run = RunState(run_id="agent-1", agent_id="agent", run_number=1)
+    state.runs[run.run_id] = run
+    return state, run
+
+
+class TestSetStatus:
+    def test_pending_to_running_to_completed(self):
+        state, run = _state_with_run()
+
+        state.set_status(run, RunStatus.RUNNING)
+        assert (state.completed_runs, state.successful_runs) == (0, 0)
+
+        state.set_status(run, RunStatus.COMPLETED)
+        assert (state.completed_runs, state.successful_runs) == (1, 1)
+        assert run.status == RunStatus.COMPLETED
+
+    def test_failed_to_completed_moves_between_counters(self):
+        state, run = _state_with_run()
+
+        state.set_status(run, RunStatus.FAILED)
+        assert (state.completed_runs, state.successful_runs) == (1, 0)
+
+        state.set_status(run, RunStatus.COMPLETED)
+        assert (state.completed_runs, state.successful_runs) == (1, 1)
+
+    def test_same_status_twice_counts_once(self):
+        state, run = _state_with_run()
+
+        state.set_status(run, RunStatus.COMPLETED)
+        state.set_status(run, RunStatus.COMPLETED)
+        assert (state.completed_runs, state.successful_runs) == (1, 1)
+
+    def test_timeout_is_not_counted_as_completed(self):
+        state, run = _state_with_run()
+
+        state.set_status(run, RunStatus.RUNNING)
+        state.set_status(run, RunStatus.TIMEOUT)
+        assert (state.completed_runs, state.successful_runs) == (0, 0)
+
+
+class TestProgressDisplay:
+    def test_start_discards_previous_render_cache(self):
+        display = ProgressDisplay(Console(file=io.StringIO()))
+        display.start("first", 2)
+        display.add_run("agent-1", "agent", 1)
+        display.add_run("agent-2", "agent", 2)
+        display.update_run("agent-1", RunStatus.FAILED, 1.0, "boom")
+        display.update_run("agent-2", RunStatus.RUNNING)
+        display._make_panel()
+        display.stop()
+
+        display.start("second", 1)
+        display.stop()
+
+        assert display._row_cache == {}
+        assert display._running == set()
+        assert display._panel is None or "second" in str(display._panel.title)
@@ -1,7 +1,10 @@
 """Tests for metrics collection."""
 
-import json
 from pathlib import Path
+from types import MappingProxyType
+
+import orjson
+import pytest
 
 from act.metrics import (
     collect_run_metrics,
@@ -9,53 +12,89 @@ from act.metrics import (
     load_container_metrics,
 )
 
+ZERO_TOKENS = MappingProxyType(
+    {"total": 0, "input": 0, "output": 0, "reasoning": 0, "cache_read": 0, "cache_write": 0}
+)
+
+TWO_MESSAGE_SESSION = orjson.dumps(
+    {
+        "info": {},
+        "messages": [
+            {
+                "info": {
+                    "tokens": {
+                        "total": 100,
+                        "input": 10,
+                        "output": 50,
+                        "reasoning": 0,
+                        "cache": {"read": 30, "write": 10},
+                    }
+                }
+            },
+            {
+                "info": {
+                    "tokens": {
+                        "total": 200,
+                        "input": 20,
+                        "output": 100,
+                        "reasoning": 5,
+                        "cache": {"read": 60, "write": 15},
+                    }
+                }
+            },
+        ],
+    }
+)
+
+ONE_MESSAGE_SESSION = orjson.dumps(
+    {
+        "info": {},
+        "messages": [
+            {
+                "info": {
+                    "tokens": {
+                        "total": 500,
+                        "input": 100,
+                        "output": 300,
+                        "reasoning": 10,
+                        "cache": {"read": 70, "write": 20},
+                    }
+                }
+            }
+        ],
+    }
+)
+
+LOADERS = [
+    (load_container_metrics, "metrics.json"),
+    (extract_token_usage_from_session, "opencode_session.json"),
+]
+
+
+@pytest.mark.parametrize("loader,filename", LOADERS)
+def test_missing_file_returns_empty_dict(loader, filename, tmp_path: Path):
+    assert not (tmp_path / filename).exists()
+    assert loader(tmp_path) == {}
+
+
+@pytest.mark.parametrize("loader,filename", LOADERS)
+def test_malformed_json_returns_empty_dict(loader, filename, tmp_path: Path):
+    (tmp_path / filename).write_bytes(b"not json{{{")
+    assert loader(tmp_path) == {}
+
 
 class TestLoadContainerMetrics:
     def test_loads_metrics_file(self, tmp_path: Path):
         metrics = {"run_id": "test-1", "exit_code": 0, "duration_seconds": 42}
-        (tmp_path / "metrics.json").write_text(json.dumps(metrics))
+        (tmp_path / "metrics.json").write_bytes(orjson.dumps(metrics))
 
         result = load_container_metrics(tmp_path)
         assert result == metrics
 
-    def test_missing_file_returns_empty_dict(self, tmp_path: Path):
-        assert load_container_metrics(tmp_path) == {}
-
-    def test_malformed_json_returns_empty_dict(self, tmp_path: Path):
-        (tmp_path / "metrics.json").write_text("not json{{{")
-        assert load_container_metrics(tmp_path) == {}
-
 
 class TestExtractTokenUsageFromSession:
     def test_sums_tokens_across_messages(self, tmp_path: Path):
-        session = {
-            "info": {},
-            "messages": [
-                {
-                    "info": {
-                        "tokens": {
-                            "total": 100,
-                            "input": 10,
-                            "output": 50,
-                            "reasoning": 0,
-                            "cache": {"read": 30, "write": 10},
-                        }
-                    }
-                },
-                {
-                    "info": {
-                        "tokens": {
-                            "total": 200,
-                            "input": 20,
-                            "output": 100,
-                            "reasoning": 5,
-                            "cache": {"read": 60, "write": 15},
-                        }
-                    }
-                },
-            ],
-        }
-        (tmp_path / "opencode_session.json").write_text(json.dumps(session))
+        (tmp_path / "opencode_session.json").write_bytes(TWO_MESSAGE_SESSION)
 
         result = extract_token_usage_from_session(tmp_path)
         assert result == {
@@ -67,12 +106,17 @@ class TestExtractTokenUsageFromSession:
             "cache_write": 25,
         }
 
-    def test_missing_file_returns_empty_dict(self, tmp_path: Path):
-        assert extract_token_usage_from_session(tmp_path) == {}
+    def test_bare_message_list(self, tmp_path: Path):
+        messages = [
+            {"info": {"tokens": {"total": 70, "input": 20, "output": 50}}},
+            {"info": {"tokens": {"total": 30, "input": 10, "output": 20}}},
+        ]
+        (tmp_path / "opencode_session.json").write_bytes(b"\n  " + orjson.dumps(messages))
 
-    def test_malformed_json_returns_empty_dict(self, tmp_path: Path):
-        (tmp_path / "opencode_session.json").write_text("broken")
-        assert extract_token_usage_from_session(tmp_path) == {}
+        result = extract_token_usage_from_session(tmp_path)
+        assert result["total"] == 100
+        assert result["input"] == 30
+        assert result["output"] == 70
 
     def test_messages_without_tokens_are_skipped(self, tmp_path: Path):
         session = {
@@ -83,52 +127,24 @@ class TestExtractTokenUsageFromSession:
                 {"other": "data"},
             ],
         }
-        (tmp_path / "opencode_session.json").write_text(json.dumps(session))
+        (tmp_path / "opencode_session.json").write_bytes(orjson.dumps(session))
 
         result = extract_token_usage_from_session(tmp_path)
-        assert result["total"] == 50
-        assert result["input"] == 10
-        assert result["output"] == 40
-        assert result["reasoning"] == 0
-        assert result["cache_read"] == 0
-        assert result["cache_write"] == 0
+        assert result == {**ZERO_TOKENS, "total": 50, "input": 10, "output": 40}
 
     def test_empty_message_list(self, tmp_path: Path):
-        (tmp_path / "opencode_session.json").write_text(json.dumps({"info": {}, "messages": []}))
+        (tmp_path / "opencode_session.json").write_bytes(orjson.dumps({"info": {}, "messages": []}))
 
         result = extract_token_usage_from_session(tmp_path)
-        assert result == {
-            "total": 0,
-            "input": 0,
-            "output": 0,
-            "reasoning": 0,
-            "cache_read": 0,
-            "cache_write": 0,
-        }
+        assert result == ZERO_TOKENS
 
 
 class TestCollectRunMetrics:
     def test_reads_token_usage_from_session(self, tmp_path: Path):
         container_metrics = {"duration_seconds": 120}
-        (tmp_path / "metrics.json").write_text(json.dumps(container_metrics))
+        (tmp_path / "metrics.json").write_bytes(orjson.dumps(container_metrics))
 
-        session = {
-            "info": {},
-            "messages": [
-                {
-                    "info": {
-                        "tokens": {
-                            "total": 500,
-                            "input": 100,
-                            "output": 300,
-                            "reasoning": 10,
-                            "cache": {"read": 70, "write": 20},
-                        }
-                    }
-                }
-            ],
-        }
-        (tmp_path / "opencode_session.json").write_text(json.dumps(session))
+        (tmp_path / "opencode_session.json").write_bytes(ONE_MESSAGE_SESSION)
 
         metrics = collect_run_metrics(
             run_id="test-1",
@@ -0,0 +1,77 @@
+"""Tests for experiment runner helpers."""
+
+import io
+import shutil
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from rich.console import Console
+
+from act import runner
+from act.config import BenchmarkConfig
+from act.display import ProgressDisplay
+from act.runner import ExperimentRunner
+
+# Two agents x two runs
+TOTAL_RUNS = 4
+
+
+def _make_runner(tmp_path: Path, workspace_tmpfs: bool) -> ExperimentRunner:
+    config = BenchmarkConfig.model_validate(
+        {
+            "experiment": {"name": "exp"},
+            "target": {"repo": "https://example.com/repo.git"},
+            "prompt": {"text": "do it"},
+            "settings": {"runs_per_agent": 2, "workspace_tmpfs": workspace_tmpfs},
+            "agents": [{"id": "a"}, {"id": "b"}],
+        }
+    )
+    display = ProgressDisplay(Console(file=io.StringIO()))
+    return ExperimentRunner(config, tmp_path / "results", display, MagicMock())
+
+
+def _fake_disk_usage(free: int):
+    def disk_usage(path):
+        return shutil._ntuple_diskusage(free, 0, free)
+
+    return disk_usage
+
+
+class TestWorkspaceRoot:
+    @pytest.fixture
+    def shm(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        shm = tmp_path / "shm"
+        shm.mkdir()
+        monkeypatch.setattr(runner, "_TMPFS_PATH", shm)
+        return shm
+
+    def test_opt_out_uses_default_temp_dir(
+        self, tmp_path: Path, shm: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        disk_usage = MagicMock()
+        monkeypatch.setattr(shutil, "disk_usage", disk_usage)
+
+        assert _make_runner(tmp_path, workspace_tmpfs=False)._workspace_root() is None
+        disk_usage.assert_not_called()
+
+    def test_missing_tmpfs_falls_back(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(runner, "_TMPFS_PATH", tmp_path / "missing")
+
+        assert _make_runner(tmp_path, workspace_tmpfs=True)._workspace_root() is None
+
+    def test_too_little_free_space_falls_back(
+        self, tmp_path: Path, shm: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        free = TOTAL_RUNS * runner._TMPFS_BYTES_PER_RUN - 1
+        monkeypatch.setattr(shutil, "disk_usage", _fake_disk_usage(free))
+
+        assert _make_runner(tmp_path, workspace_tmpfs=True)._workspace_root() is None
+
+    def test_enough_free_space_uses_tmpfs(
+        self, tmp_path: Path, shm: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        free = TOTAL_RUNS * runner._TMPFS_BYTES_PER_RUN
+        monkeypatch.setattr(shutil, "disk_usage", _fake_disk_usage(free))
+
+        assert _make_runner(tmp_path, workspace_tmpfs=True)._workspace_root() == shm